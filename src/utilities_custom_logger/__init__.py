@@ -10,4 +10,8 @@ __all__ = [
 ]
 
 # comment: package-level version, sourced from pyproject.toml via get_logger_version()
-__version__ = get_logger_version()
+# comment: resolved once here (cached); a failing lookup must never abort import
+try:
+    __version__ = get_logger_version()
+except Exception:
+    from .custom_logger import __version__
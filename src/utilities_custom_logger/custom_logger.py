@@ -7,24 +7,19 @@ Supports config-driven base paths and multiple output files.
 Author: Daniel Drew
 """
 
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-import traceback
+import threading
 from rich.logging import RichHandler
 from rich.console import Console
 from pathlib import Path
-from typing import Optional
-
-# --- version metadata -------------------------------------------------------
-# comment: compat import for Python 3.7–3.10+
-try:
-    # Python 3.8+
-    from importlib.metadata import PackageNotFoundError, version as _pkg_version  # noqa
-except ImportError:  # Python < 3.8
-    from importlib_metadata import (  # type: ignore[import]
-        PackageNotFoundError,
-        version as _pkg_version,
-    )
+from typing import Optional, Union
 
 # prevent multiple installations across repeated setup_logger calls
 _EXC_HOOKS_INSTALLED = False
@@ -32,11 +27,21 @@ _ORIG_SYS_EXCEPTHOOK = None
 _ORIG_THREADING_EXCEPTHOOK = None
 _ORIG_ASYNCIO_HANDLER = None
 
+# Rich console shared across setup_logger calls (terminal probing happens once per process)
+_RICH_CONSOLE: Optional[Console] = None
+
+# background thread that owns the file handlers (replaced on each setup_logger call)
+_QUEUE_LISTENER: Optional[logging.handlers.QueueListener] = None
+
 _PACKAGE_NAME = "utilities_custom_logger"  # matches pyproject.toml
+_LOGGER_NAME = "config_loader_logger"
+_FORK_DRAIN_TIMEOUT = 5.0  # max seconds os.fork() waits for the file listener to catch up
+_FILE_BUFFER_SIZE = 1 << 16  # write buffer for log file streams (bytes)
 # Optional fallback module-defined version if metadata not available
 __version__ = "0.3.0"
 
 
+@functools.lru_cache(maxsize=1)
 def get_logger_version() -> str:
     """Return the version string for this logging utility.
 
@@ -45,9 +50,26 @@ def get_logger_version() -> str:
            (from pyproject.toml).
         2. Local ``__version__`` constant as a fallback.
 
+    The result is cached, so the metadata lookup (a scan of sys.path for
+    dist-info) happens at most once per process.
+
     Returns:
         str: Semantic version string, e.g. "0.3.0".
     """
+    # --- version metadata -------------------------------------------------------
+    # comment: imported lazily so importlib.metadata is only loaded when asked for
+    try:
+        # Python 3.8+
+        from importlib.metadata import PackageNotFoundError, version as _pkg_version  # noqa
+    except ImportError:  # Python < 3.8
+        try:
+            from importlib_metadata import (  # type: ignore[import]
+                PackageNotFoundError,
+                version as _pkg_version,
+            )
+        except ImportError:
+            return __version__
+
     try:
         return _pkg_version(_PACKAGE_NAME)
     except PackageNotFoundError:
@@ -70,30 +92,336 @@ class AlignedFileFormatter(logging.Formatter):
         super().__init__(datefmt=datefmt)
         self.message_col: int = message_col  # where the *message* should start
         self.source_col: int = source_col  # where the source should start (first line only)
+        # precomputed per-record constants: continuation indent
+        self._cont_prefix: str = " " * message_col
+        self._cont_sep: str = "\n" + self._cont_prefix
+        # first line in one str.format call: {0}=prefix (padded to message_col), {1}=message
+        # (padded to width {3}), then the mandatory 1-space gap and {2}=source
+        self._first_line_tmpl: str = "{0:<%d}{1:<{3}} {2}" % message_col
+        # (whole second, formatted timestamp, {levelname: layout}) — a datefmt has 1 s resolution,
+        # so the timestamp and each level's prebuilt prefix are reused within a second
+        # (not used for datefmt=None, whose default format includes msecs).
+        # Kept in one tuple so a thread switching seconds can't pair a prefix with the wrong ts.
+        self._ts_cache: tuple = (None, "", {})
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = self.formatTime(record, self.datefmt)
+        # the same formatter is shared by console/file/error handlers: format each record once.
+        # The cache, stored as record._aligned_cached = (id(formatter), msg, args, text), is only
+        # reused while record.msg/record.args are still the same objects, so a filter that replaces
+        # them gets fresh text. Caveats: in-place mutation of msg/args (e.g. a dict arg) between
+        # handlers is not detected, and serializers that dump every record attribute (JSON
+        # formatters, SocketHandler pickles) will include the `_aligned_cached` attribute.
+        cached = record.__dict__.get("_aligned_cached")
+        if (cached is not None and cached[0] == id(self)
+                and cached[1] is record.msg and cached[2] is record.args):
+            return cached[3]
+        text = self._format_aligned(record)
+        record.__dict__["_aligned_cached"] = (id(self), record.msg, record.args, text)
+        return text
+
+    def _layout(self, ts: str, lvl: str) -> tuple:
+        """Return (prefix, width) for a timestamp/level: the first-line prefix and the space left
+        for message + source before source_col, i.e. everything except the per-record parts."""
+        # prefix up to (but not including) the message, incl. the mandatory 1-space gap
+        prefix = f"{ts} [{lvl}]  "
+        return prefix, self.source_col - 1 - max(len(prefix), self.message_col)
+
+    def _format_aligned(self, record: logging.LogRecord) -> str:
         lvl = record.levelname
+        if self.datefmt is None:
+            # logging's default time format appends msecs: sub-second output, nothing to reuse
+            layout = self._layout(self.formatTime(record, None), lvl)
+        else:
+            cache = self._ts_cache
+            sec = int(record.created)
+            if sec != cache[0]:
+                cache = self._ts_cache = (sec, self.formatTime(record, self.datefmt), {})
+            layout = cache[2].get(lvl)
+            if layout is None:
+                layout = cache[2][lvl] = self._layout(cache[1], lvl)
+        prefix, width = layout
         src = f"{record.filename}:{record.lineno}"
 
-        # prefix up to (but not including) the message
-        prefix = f"{ts} [{lvl}] "
-        # compute padding so message starts at message_col
-        pad_to_msg = max(1, self.message_col - len(prefix))
-        msg_lines = (record.getMessage() or "").splitlines() or [""]
-
-        # first line left part (prefix + spaces + first msg line)
-        left_first = f"{prefix}{' ' * pad_to_msg}{msg_lines[0]}"
+        msg = record.getMessage() or ""
+        # fast path: single-line messages (the common case) are a single format call.
+        # every line boundary splitlines() knows (\n \r \v \f \x1c-\x1e \x85 \u2028 \u2029)
+        # is non-printable, so a printable message is guaranteed to be one line
+        if msg.isprintable():
+            return self._first_line_tmpl.format(prefix, msg, src, max(width - len(src), 0))
+        msg_lines = msg.splitlines() or [""]
 
-        # add spacing so source begins at source_col (at least 1 space gap)
-        pad_to_src = max(1, self.source_col - len(left_first) - len(src))
-        first_line = f"{left_first}{' ' * pad_to_src}{src}"
+        # message starts at message_col; pad it so the source ends at source_col (at least 1 space gap)
+        first_line = self._first_line_tmpl.format(prefix, msg_lines[0], src, max(width - len(src), 0))
+        if len(msg_lines) == 1:
+            return first_line
 
         # continuation lines: start exactly at message_col with 4 spaces before text if you prefer
-        cont_prefix = " " * self.message_col
-        cont_lines = [f"{cont_prefix}{line}" for line in msg_lines[1:]]
+        # (newline + indent is the join separator, so the output is built in one join)
+        return first_line + self._cont_sep + self._cont_sep.join(msg_lines[1:])
+
+
+class _PlainConsoleFormatter(logging.Formatter):
+    """
+    Console formatter for the non-TTY StreamHandler: the aligned text from `base`, followed by
+    the plain traceback for `exc_info` records (logger.exception(), exc_info=True).
+
+    On a TTY, RichHandler renders those tracebacks itself; AlignedFileFormatter deliberately
+    leaves them out so the (shared, cached) aligned text stays the same for every handler.
+    """
+
+    def __init__(self, base: logging.Formatter):
+        super().__init__()
+        self.base: logging.Formatter = base
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = self.base.format(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text = f"{text}\n{record.exc_text}"
+        return text
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler tuned for batched writes:
+      - opens its stream with a large write buffer (fewer, larger write() syscalls)
+      - does not flush after every record; flushing happens on flush()/close()
+    Intended to be constructed with delay=True so the file is only opened on first use.
+    In "w" mode an existing file is still truncated at construction, so a run that logs
+    nothing (e.g. a clean run's ERROR file) doesn't leave the previous run's records behind.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._defer_flush: bool = False
+        super().__init__(*args, **kwargs)
+        if self.stream is None and self.mode == "w" and os.path.exists(self.baseFilename):
+            open(self.baseFilename, "w").close()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit() flushes after each record; defer that to the batch flush
+        self._defer_flush = True
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target once per batch instead of once per record."""
+
+    def flush(self) -> None:
+        super().flush()
+        if self.target:
+            self.target.flush()
+
+
+class _IdleFlushQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its (buffered) handlers as soon as the queue runs empty."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        if isinstance(record, threading.Event):
+            # drain barrier from _before_fork: everything queued before it has been handled
+            record.set()
+            return
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+# coalesce file writes: records are buffered and handed to the FileHandler in batches
+def _buffered(handler: logging.Handler, capacity: int) -> logging.handlers.MemoryHandler:
+    """
+    Wrap `handler` in a MemoryHandler so many records reach the file in a single burst.
+
+    The buffer is flushed when `capacity` records are pending, when a WARNING+ record
+    arrives, whenever the listener's queue runs empty (see _IdleFlushQueueListener), and
+    on close (at interpreter exit via _stop_queue_listener). So batching only kicks in
+    under sustained load; a quiet or killed job still has its records on disk. The wrapper
+    takes the target's level because MemoryHandler.flush() bypasses the target's level check.
+
+    Args:
+        handler: The FileHandler that actually writes the records.
+        capacity: Number of records to buffer before flushing.
+
+    Returns:
+        logging.handlers.MemoryHandler: The handler to attach to the logger.
+    """
+    buffered = _BatchMemoryHandler(
+        capacity=capacity,
+        flushLevel=logging.WARNING,
+        target=handler,
+        flushOnClose=True,
+    )
+    buffered.setLevel(handler.level)
+    return buffered
+
 
-        return "\n".join([first_line] + cont_lines)
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that hands records to the listener thread *unformatted*.
+
+    The stock prepare() renders the record with a plain Formatter (appending exc_text);
+    here only the message args are merged, so AlignedFileFormatter on the listener side
+    produces exactly the same file output as a directly attached handler.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # merge args now: the caller may mutate them before the listener gets to the record
+        orig = record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        # carry over AlignedFileFormatter's cached text (if still valid) under the new msg/args
+        cached = record.__dict__.pop("_aligned_cached", None)
+        if cached is not None and cached[1] is orig.msg and cached[2] is orig.args:
+            record.__dict__["_aligned_cached"] = (cached[0], record.msg, None, cached[3])
+        return record
+
+    def close(self) -> None:
+        # logging.shutdown() closes the newest handlers first: drain the queue into the files
+        # before the file handlers themselves are flushed and closed
+        if getattr(self, "listener", None) is not None and self.listener is _QUEUE_LISTENER:
+            _stop_queue_listener()
+        super().close()
+
+
+def _stop_queue_listener() -> None:
+    """Drain and stop the file-writing listener thread (if any), then close its handlers."""
+    global _QUEUE_LISTENER
+    listener, _QUEUE_LISTENER = _QUEUE_LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close() flushes and then drops its target without closing it
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+# runs before logging.shutdown (atexit is LIFO), so queued records still reach the files
+atexit.register(_stop_queue_listener)
+
+
+# --- fork support -----------------------------------------------------------
+# The listener thread does not survive os.fork(): without these hooks a child's records would
+# sit in a queue nobody reads. Parent and child must also not both write the same buffered bytes.
+def _before_fork() -> None:
+    """Parent, just before fork: empty the file buffers and hold their locks across the fork."""
+    listener = _QUEUE_LISTENER
+    if listener is None:
+        return
+    # let the listener write out what is already queued, so file order matches call order
+    if getattr(listener, "_thread", None) is not None:
+        drained = threading.Event()
+        listener.queue.put(drained)
+        drained.wait(timeout=_FORK_DRAIN_TIMEOUT)
+    for buffered in listener.handlers:
+        target = buffered.target
+        buffered.acquire()
+        target.acquire()
+        # open lazily-delayed files now so parent and child share one fd (and file offset)
+        if target.stream is None and not getattr(target, "_closed", False):
+            target.stream = target._open()
+        # nothing pending may be inherited, or the child would write it a second time
+        buffered.flush()
+
+
+def _after_fork_in_parent() -> None:
+    listener = _QUEUE_LISTENER
+    if listener is None:
+        return
+    for buffered in reversed(listener.handlers):
+        buffered.target.release()
+        buffered.release()
+
+
+def _after_fork_in_child() -> None:
+    """Child: no listener thread here, so write the files directly (flushed per record).
+
+    Records still queued at fork time belong to the parent, whose listener writes them; the
+    child drops the queue. Children often leave via os._exit() (multiprocessing), skipping
+    atexit, hence per-record flushing instead of buffering. Handler locks were already
+    re-initialised by logging's own after-fork hook (registered first, so it runs first).
+    """
+    global _QUEUE_LISTENER
+    listener, _QUEUE_LISTENER = _QUEUE_LISTENER, None
+    if listener is None:
+        return
+    logger = logging.getLogger(_LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if isinstance(handler, _RecordQueueHandler):
+            logger.removeHandler(handler)
+    for buffered in listener.handlers:
+        target = buffered.target
+        if target.stream is None:
+            continue
+        direct = logging.StreamHandler(target.stream)
+        direct.setLevel(target.level)
+        direct.setFormatter(target.formatter)
+        logger.addHandler(direct)
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(before=_before_fork,
+                        after_in_parent=_after_fork_in_parent,
+                        after_in_child=_after_fork_in_child)
+
+
+class _NoLock:
+    """Stand-in for a handler's RLock when setup_logger(single_threaded=True) is used."""
+
+    __slots__ = ()
+
+    def acquire(self, *args, **kwargs) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+    def _at_fork_reinit(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+def _drop_handler_lock(handler: logging.Handler) -> None:
+    """Replace `handler`'s lock with a no-op so handle()/flush() skip the RLock round-trip."""
+    # a no-op object rather than None: Python ≥3.13 uses `with self.lock:` in Handler.handle()
+    handler.lock = _NoLock()
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of `path` if missing (one stat() when it already exists)."""
+    parent = os.path.dirname(path)
+    if parent and not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+
+
+def _stdout_isatty() -> bool:
+    """Return True if sys.stdout is attached to an interactive terminal."""
+    try:
+        return sys.stdout is not None and sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        # replaced/closed stdout (e.g. some test runners) — treat as non-interactive
+        return False
 
 
 # hook uncaught exceptions into the configured logger
@@ -107,7 +435,7 @@ def _install_exception_logging(logger: logging.Logger) -> None:
         log message text.
       • threading.excepthook (Py ≥3.8): logs uncaught exceptions from worker threads,
         including the thread name, with full traceback text.
-      • asyncio exception handler (if an event loop exists now): logs unhandled
+      • asyncio exception handler (if an event loop is running now): logs unhandled
         exceptions and context errors originating from the active loop.
 
     Design notes:
@@ -125,14 +453,12 @@ def _install_exception_logging(logger: logging.Logger) -> None:
     if _EXC_HOOKS_INSTALLED:
         return
 
-    import sys
-    import threading
-    import asyncio
     import traceback as _tb
 
     # Helper: format a full traceback string for any (type, value, tb) triple.
+    # comment: joins the TracebackException.format() generator directly (format_exception builds a list first)
     def _fmt_exc(exc_type, exc, tb) -> str:
-        return "".join(_tb.format_exception(exc_type, exc, tb))
+        return "".join(_tb.TracebackException(exc_type, exc, tb, compact=True).format())
 
     # ---- sys.excepthook (main thread / baseline for others) ----
     _ORIG_SYS_EXCEPTHOOK = sys.excepthook
@@ -141,6 +467,9 @@ def _install_exception_logging(logger: logging.Logger) -> None:
         if issubclass(exc_type, KeyboardInterrupt):
             # Preserve Ctrl-C behavior; do not log.
             return _ORIG_SYS_EXCEPTHOOK(exc_type, exc, tb)
+        if not logger.isEnabledFor(logging.ERROR):
+            # Logger silenced: skip traceback formatting entirely.
+            return _ORIG_SYS_EXCEPTHOOK(exc_type, exc, tb)
         logger.error("Uncaught exception\n%s", _fmt_exc(exc_type, exc, tb))
         # Still print the default traceback to the terminal.
         return _ORIG_SYS_EXCEPTHOOK(exc_type, exc, tb)
@@ -154,35 +483,44 @@ def _install_exception_logging(logger: logging.Logger) -> None:
         def _thread_hook(args: "threading.ExceptHookArgs"):
             if issubclass(args.exc_type, KeyboardInterrupt):
                 return
-            logger.error(
-                "Uncaught thread exception (%s)\n%s",
-                getattr(args.thread, "name", "unknown"),
-                _fmt_exc(args.exc_type, args.exc_value, args.exc_traceback),
-            )
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Uncaught thread exception (%s)\n%s",
+                    getattr(args.thread, "name", "unknown"),
+                    _fmt_exc(args.exc_type, args.exc_value, args.exc_traceback),
+                )
             # Delegate to the original thread hook (if it isn’t ourselves).
             if _ORIG_THREADING_EXCEPTHOOK is not _thread_hook:
                 _ORIG_THREADING_EXCEPTHOOK(args)
 
         threading.excepthook = _thread_hook
 
-    # ---- asyncio loop exceptions (only if a loop exists now) ----
+    # ---- asyncio loop exceptions (only if a loop is running now) ----
+    # comment: asyncio is only looked up, never imported here — if nothing imported it, no loop exists
+    asyncio = sys.modules.get("asyncio")
     _ORIG_ASYNCIO_HANDLER = None
     try:
-        loop = asyncio.get_event_loop()
+        # get_running_loop() never creates a loop or emits get_event_loop()'s DeprecationWarning
+        try:
+            loop = asyncio.get_running_loop() if asyncio is not None else None
+        except RuntimeError:
+            loop = None
         if loop and not loop.is_closed():
             _ORIG_ASYNCIO_HANDLER = loop.get_exception_handler()
 
             def _asyncio_handler(loop, context):
-                exc = context.get("exception")
-                if exc is not None:
-                    # exc.__traceback__ may be None in rare cases; format_exception handles it.
-                    logger.error(
-                        "Unhandled asyncio exception\n%s",
-                        "".join(_tb.format_exception(type(exc), exc, exc.__traceback__)),
-                    )
-                else:
-                    # No exception object; include context message/details.
-                    logger.error("Unhandled asyncio error: %s", context.get("message", context))
+                # Skip traceback formatting entirely when the logger is silenced.
+                if logger.isEnabledFor(logging.ERROR):
+                    exc = context.get("exception")
+                    if exc is not None:
+                        # exc.__traceback__ may be None in rare cases; format_exception handles it.
+                        logger.error(
+                            "Unhandled asyncio exception\n%s",
+                            _fmt_exc(type(exc), exc, exc.__traceback__),
+                        )
+                    else:
+                        # No exception object; include context message/details.
+                        logger.error("Unhandled asyncio error: %s", context.get("message", context))
                 # Delegate to original/default handler so terminal output remains.
                 if _ORIG_ASYNCIO_HANDLER:
                     _ORIG_ASYNCIO_HANDLER(loop, context)
@@ -191,7 +529,7 @@ def _install_exception_logging(logger: logging.Logger) -> None:
 
             loop.set_exception_handler(_asyncio_handler)
     except Exception:
-        # No active loop available at install time (common for non-async CLIs) — that's fine.
+        # Loop unusable at install time — that's fine; non-async CLIs have no loop at all.
         pass
 
     _EXC_HOOKS_INSTALLED = True
@@ -199,10 +537,13 @@ def _install_exception_logging(logger: logging.Logger) -> None:
 
 def setup_logger(log_file: Optional[Path] = None,
                  error_log_file: Optional[Path] = None,
-                 level: str = "INFO",
+                 level: Union[str, int] = "INFO",
                  overwrite: bool = True,
                  width: int = 220,
                  exceptions: bool = True,  # <--- new
+                 single_threaded: bool = False,
+                 console: Optional[Console] = None,
+                 rich_tracebacks: bool = True,
                  ) -> logging.Logger:
     """
     Configure a logger with rich formatting, full file output, and error-specific file.
@@ -210,18 +551,35 @@ def setup_logger(log_file: Optional[Path] = None,
     Args:
         log_file (Optional[Path]): File path for general logs.
         error_log_file (Optional[Path]): File path for ERROR+ logs.
-        level (str): Logging level threshold (e.g., 'DEBUG', 'INFO').
+        level (Union[str, int]): Logging level threshold (e.g., 'DEBUG', 'INFO', or logging.INFO).
         overwrite (bool): Flag to overwrite append or file if exists.
         width (int): Width of each log line.
         exceptions (bool): Log uncaught exceptions, defaults to True.
+        single_threaded (bool): Skip handler locking for the handlers attached to the logger
+            (console + queue). Only safe if a single thread logs; defaults to False. The file
+            handlers keep their locks since the listener thread owns them.
+        console (Optional[Console]): Rich console to log to (always uses Rich, even when stdout
+            is not a TTY). Defaults to a process-wide console on sys.stdout.
+        rich_tracebacks (bool): Let Rich render `exc_info` tracebacks (logger.exception()) on the
+            console; defaults to True. Only applies when Rich is used (stdout is a TTY or a
+            `console` is passed); the plain non-TTY console always appends them as text.
+            Uncaught-exception records from the hooks carry their traceback as message text
+            and are unaffected, so False skips Rich's traceback rendering at no loss for hook output.
 
     Returns:
         logging.Logger: Configured logger instance.
     """
-    logger = logging.getLogger("config_loader_logger")
+    global _QUEUE_LISTENER, _RICH_CONSOLE
+    logger = logging.getLogger(_LOGGER_NAME)
+    # write out and close file handlers from a previous setup before replacing them
+    _stop_queue_listener()
     if logger.hasHandlers():
         logger.handlers.clear()
-    logger.setLevel(level.upper())
+    # resolve the level once; names are case-insensitive, ints are used as-is
+    lvl_num = int(level) if not isinstance(level, str) else logging.getLevelName(level.upper())
+    if not isinstance(lvl_num, int):
+        raise ValueError(f"Unknown level: {level!r}")
+    logger.setLevel(lvl_num)
 
     # Standard formatter for files AND console (aligned columns)
     file_fmt = AlignedFileFormatter(
@@ -230,57 +588,88 @@ def setup_logger(log_file: Optional[Path] = None,
         source_col=width,
     )
 
-    # Console handler with Rich, but using our aligned formatter
-    # comment: disable Rich's own wrapping so lines aren't hard-wrapped at 80 cols when piped/tee'd
-    console = Console(
-        file=sys.stdout,
-        soft_wrap=True,     # don't hard-wrap or crop text at terminal width
-        width=None,         # let it print full lines even when not a TTY
-    )
-
-    rich_handler = RichHandler(
-        console=console,
-        rich_tracebacks=True,
-        show_time=False,
-        show_level=False,
-        show_path=False,
-        log_time_format="%Y-%m-%d %H:%M:%S",
-        omit_repeated_times=False,
-    )
-    rich_handler.setFormatter(file_fmt)
-    logger.addHandler(rich_handler)
+    # Console handler: Rich on an interactive terminal, plain StreamHandler when piped/redirected
+    # comment: Rich's per-record rendering is wasted when nobody is looking at a terminal
+    if console is not None or _stdout_isatty():
+        if console is None:
+            # comment: built once and reused, unless sys.stdout has been swapped since
+            if _RICH_CONSOLE is None or _RICH_CONSOLE.file is not sys.stdout:
+                # comment: disable Rich's own wrapping so lines aren't hard-wrapped at 80 cols when piped/tee'd
+                _RICH_CONSOLE = Console(
+                    file=sys.stdout,
+                    soft_wrap=True,     # don't hard-wrap or crop text at terminal width
+                    width=None,         # let it print full lines even when not a TTY
+                )
+            console = _RICH_CONSOLE
+
+        console_handler = RichHandler(
+            console=console,
+            rich_tracebacks=rich_tracebacks,
+            show_time=False,
+            show_level=False,
+            show_path=False,
+            log_time_format="%Y-%m-%d %H:%M:%S",
+            omit_repeated_times=False,
+        )
+        console_handler.setFormatter(file_fmt)
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        # no Rich traceback rendering here: append exc_info tracebacks as plain text
+        console_handler.setFormatter(_PlainConsoleFormatter(file_fmt))
+    logger.addHandler(console_handler)
 
+    # file handlers are not attached to the logger; they run on a QueueListener thread (see below)
+    file_handlers = []
     if log_file:
-        log_file = Path(log_file).resolve()
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file,
-                                           mode=("w" if overwrite else "a"),
-                                           encoding="utf-8")
-        file_handler.setLevel(level.upper())
+        log_file = os.path.abspath(os.fspath(log_file))
+        _ensure_parent_dir(log_file)
+        file_handler = _BufferedFileHandler(log_file,
+                                            mode=("w" if overwrite else "a"),
+                                            encoding="utf-8",
+                                            delay=True)
+        file_handler.setLevel(lvl_num)
         file_handler.setFormatter(file_fmt)
         # file_handler.addFilter(IndentMultilineFilterTabs())
-        logger.addHandler(file_handler)
+        file_handlers.append(_buffered(file_handler, capacity=1024))
 
     # ---- Optional dedicated ERROR+ file ----
     if error_log_file:
-        err_path = Path(error_log_file).resolve()
-        std_path = Path(log_file).resolve() if log_file else None
+        err_path = os.path.abspath(os.fspath(error_log_file))
+        std_path = log_file if log_file else None  # already absolute (see above)
 
         # Only add a separate ERROR handler if it's a different file than the standard log
-        if std_path is None or err_path != std_path:
-            err_path.parent.mkdir(parents=True, exist_ok=True)
-            err_handler = logging.FileHandler(err_path, mode=("w" if overwrite else "a"), encoding="utf-8")
+        # comment: compare realpaths — a symlink to log_file must not get a second handler on the same
+        # inode (two buffers/offsets in "w" mode would overwrite each other's bytes)
+        if std_path is None or os.path.realpath(err_path) != os.path.realpath(std_path):
+            _ensure_parent_dir(err_path)
+            err_handler = _BufferedFileHandler(err_path, mode=("w" if overwrite else "a"), encoding="utf-8",
+                                               delay=True)
             err_handler.setLevel(logging.ERROR)
             err_handler.setFormatter(file_fmt)
-            logger.addHandler(err_handler)
+            # small buffer: keep the error file close to real time
+            file_handlers.append(_buffered(err_handler, capacity=16))
     else:
         # No error file provided:
         # fall back to sending ERROR+ messages to the standard log (handled by the general file handler if present)
         pass  # (no extra handler needed; errors will already flow to console and to log_file if set)
 
+    # ---- File I/O off the calling thread ----
+    # comment: producers only enqueue; one listener thread formats and writes both files
+    if file_handlers:
+        log_queue = queue.SimpleQueue()
+        _QUEUE_LISTENER = _IdleFlushQueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        _QUEUE_LISTENER.start()
+        queue_handler = _RecordQueueHandler(log_queue)
+        queue_handler.listener = _QUEUE_LISTENER
+        logger.addHandler(queue_handler)
+
+    if single_threaded:
+        for handler in logger.handlers:
+            _drop_handler_lock(handler)
+
     logger.propagate = False
 
-    if exceptions:
+    if exceptions and not _EXC_HOOKS_INSTALLED:
         _install_exception_logging(logger)
     return logger
 